@@ -0,0 +1,358 @@
+"""Course designer: lay out gates and asteroids, then save to course.json."""
+
+import math
+
+import numpy as np
+import orjson
+import pygame
+
+from game_objects import AsteroidPool, GatePool
+from renderer import (COLOR_BG, COLOR_TEXT, Camera, draw_asteroid, draw_gate)
+from utils import (q_from_axis_angle, q_from_axis_angle_into, q_multiply,
+                   qv_rotate_fast)
+
+# Scratch quaternion for the held-key rotation path (up to six writes a
+# frame while a rotate key is down).
+_ROT_SCRATCH = np.empty(4)
+
+WIDTH, HEIGHT = 1280, 720
+SIDEBAR_WIDTH = 280
+MAIN_VIEW_WIDTH = WIDTH - SIDEBAR_WIDTH
+
+COLOR_GRID = (35, 35, 55)
+COLOR_BOUNDARY = (90, 40, 40)
+COLOR_SIDEBAR = (25, 25, 35)
+COLOR_SELECTED = (255, 220, 80)
+
+COURSE_FILE = 'course.json'
+
+BOUNDARY_EDGES = [(0, 1), (1, 3), (3, 2), (2, 0),
+                  (4, 5), (5, 7), (7, 6), (6, 4),
+                  (0, 4), (1, 5), (2, 6), (3, 7)]
+
+
+def rotate_object(obj, axis, angle):
+    """Apply an incremental rotation, keeping the quaternion unit length.
+
+    Without the renormalize, holding a rotate key for a few thousand
+    frames lets floating-point drift accumulate in the orientation.
+    """
+    w, x, y, z = q_multiply(q_from_axis_angle_into(axis, angle, _ROT_SCRATCH),
+                            obj.orientation)
+    inv = 1.0 / math.sqrt(w * w + x * x + y * y + z * z)
+    obj.orientation = (w * inv, x * inv, y * inv, z * inv)
+
+
+def object_visible(camera, forward, focal, position, radius, p):
+    """Cheap cull: does the object's bounding circle touch the main view?"""
+    if p is None:
+        return False
+    depth = np.dot(position - camera.position, forward)
+    r = radius * focal / depth
+    return not (p[0] + r < 0 or p[0] - r > MAIN_VIEW_WIDTH
+                or p[1] + r < 0 or p[1] - r > HEIGHT)
+
+
+def save_course_to_file(filepath, boundary_size, gates, asteroids):
+    # orjson serializes the numpy arrays natively - no .tolist() copies.
+    course_data = {
+        'boundary_size': boundary_size,
+        'gates': [{'position': g.position,
+                   'size': g.size,
+                   'orientation': g.orientation} for g in gates],
+        'asteroids': [{'position': a.position,
+                       'size': a.size,
+                       'orientation': a.orientation,
+                       'angular_velocity': a.angular_velocity,
+                       'model_id': str(a.model_id)} for a in asteroids],
+    }
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(course_data,
+                             option=orjson.OPT_SERIALIZE_NUMPY
+                             | orjson.OPT_INDENT_2))
+
+
+def load_course_from_file(filepath):
+    with open(filepath, 'rb') as f:
+        data = orjson.loads(f.read())
+    gates = GatePool()
+    for g in data.get('gates', []):
+        gates.add(**g)
+    asteroids = AsteroidPool()
+    for a in data.get('asteroids', []):
+        asteroids.add(**a)
+    return data.get('boundary_size', 20000.0), gates, asteroids
+
+
+class DesignerCamera(Camera):
+    """Orbit camera controlled with the mouse."""
+
+    def __init__(self, width, height):
+        super().__init__(width, height, position=[0.0, 3000.0, -8000.0])
+
+    def orbit(self, dx, dy):
+        offset = self.position - self.target
+        yaw = q_from_axis_angle([0.0, 1.0, 0.0], -dx * 0.005)
+        offset = qv_rotate_fast(yaw, offset)
+        right = np.cross(self.up, offset)
+        right_norm = np.linalg.norm(right)
+        if right_norm > 1e-6:  # skip pitch when looking straight up/down
+            pitch = q_from_axis_angle(right / right_norm, dy * 0.005)
+            offset = qv_rotate_fast(pitch, offset)
+        self.position = self.target + offset
+
+    def zoom(self, amount):
+        offset = self.position - self.target
+        self.position = self.target + offset * (1.0 - amount * 0.1)
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption('Course Designer')
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont('consolas', 16)
+
+    # font.render is pure in (text, color); most labels repeat for many
+    # frames, so blit cached surfaces instead of re-rasterizing.
+    label_cache = {}
+
+    def render_label(text, color=COLOR_TEXT):
+        key = (text, color)
+        surface = label_cache.get(key)
+        if surface is None:
+            if len(label_cache) > 256:
+                label_cache.clear()
+            surface = font.render(text, True, color)
+            label_cache[key] = surface
+        return surface
+
+    camera = DesignerCamera(MAIN_VIEW_WIDTH, HEIGHT)
+    scene_gates = GatePool()
+    scene_asteroids = AsteroidPool()
+    boundary_size = 20000.0
+    selected = None  # ('gate' | 'asteroid', index)
+    status_message = ''
+    status_timer = 0.0
+    orbiting = False
+    rot_speed = 0.02
+
+    grid_size, grid_step = 5000, 250
+    # Grid endpoints as one contiguous (K, 3) array built from broadcasts;
+    # consecutive pairs form line segments (z-lines then x-lines per step).
+    steps = np.arange(-grid_size, grid_size + 1, grid_step, dtype=float)
+    grid_verts = np.zeros((4 * len(steps), 3))
+    grid_verts[0::4, 0] = -grid_size
+    grid_verts[0::4, 2] = steps
+    grid_verts[1::4, 0] = grid_size
+    grid_verts[1::4, 2] = steps
+    grid_verts[2::4, 0] = steps
+    grid_verts[2::4, 2] = -grid_size
+    grid_verts[3::4, 0] = steps
+    grid_verts[3::4, 2] = grid_size
+
+    # Boundary cube vertices, rebuilt only when boundary_size changes.
+    boundary_cache = (None, None)
+
+    running = True
+    while running:
+        delta_time = clock.tick(60) / 1000.0
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1 and event.pos[0] < MAIN_VIEW_WIDTH:
+                    mx, my = event.pos
+                    selected = None
+                    n_gates = len(scene_gates)
+                    n_objects = n_gates + len(scene_asteroids)
+                    if n_objects > 0:
+                        # One batched projection of every center, then an
+                        # argmin over squared pixel distance.
+                        centers = np.empty((n_objects, 3))
+                        for i, gate in enumerate(scene_gates):
+                            centers[i] = gate.position
+                        centers[n_gates:] = \
+                            scene_asteroids.positions[:len(scene_asteroids)]
+                        xy, ok = camera.project_points(centers)
+                        d2 = (xy[:, 0] - mx) ** 2.0 + (xy[:, 1] - my) ** 2.0
+                        d2 = np.where(ok, d2, np.inf)
+                        i = int(np.argmin(d2))
+                        if d2[i] < 20.0 ** 2:
+                            if i < n_gates:
+                                selected = ('gate', i)
+                            else:
+                                selected = ('asteroid', i - n_gates)
+                elif event.button == 3:
+                    orbiting = True
+                elif event.button == 4:
+                    camera.zoom(1.0)
+                elif event.button == 5:
+                    camera.zoom(-1.0)
+            elif event.type == pygame.MOUSEBUTTONUP:
+                if event.button == 3:
+                    orbiting = False
+            elif event.type == pygame.MOUSEMOTION:
+                if orbiting:
+                    camera.orbit(event.rel[0], event.rel[1])
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_n:
+                    scene_gates.add(camera.target.copy())
+                    selected = ('gate', len(scene_gates) - 1)
+                elif event.key == pygame.K_m:
+                    scene_asteroids.add(camera.target.copy(), 300.0)
+                    selected = ('asteroid', len(scene_asteroids) - 1)
+                elif event.key == pygame.K_p:
+                    scene_asteroids.extend_random(50, boundary_size)
+                    status_message = f'{len(scene_asteroids)} asteroids'
+                    status_timer = 2.0
+                elif event.key in (pygame.K_x, pygame.K_DELETE):
+                    if selected is not None:
+                        kind, index = selected
+                        if kind == 'gate':
+                            scene_gates.remove(index)
+                        else:
+                            scene_asteroids.remove(index)
+                        selected = None
+                elif event.key == pygame.K_s:
+                    save_course_to_file(COURSE_FILE, boundary_size,
+                                        scene_gates, scene_asteroids)
+                    status_message = f'Saved {COURSE_FILE}'
+                    status_timer = 2.0
+                elif event.key == pygame.K_l:
+                    try:
+                        boundary_size, scene_gates, scene_asteroids = \
+                            load_course_from_file(COURSE_FILE)
+                        status_message = f'Loaded {COURSE_FILE}'
+                    except FileNotFoundError:
+                        status_message = f'{COURSE_FILE} not found'
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        status_message = f'{COURSE_FILE} is not a valid course'
+                    selected = None
+                    status_timer = 2.0
+                elif event.key == pygame.K_EQUALS:
+                    boundary_size += 1000.0
+                elif event.key == pygame.K_MINUS:
+                    boundary_size = max(2000.0, boundary_size - 1000.0)
+
+        keys = pygame.key.get_pressed()
+        if selected is not None:
+            kind, index = selected
+            obj = scene_gates[index] if kind == 'gate' else scene_asteroids[index]
+            move = 10.0
+            if keys[pygame.K_q]:
+                rotate_object(obj, [0.0, 1.0, 0.0], rot_speed)
+            if keys[pygame.K_e]:
+                rotate_object(obj, [0.0, 1.0, 0.0], -rot_speed)
+            if keys[pygame.K_r]:
+                rotate_object(obj, [1.0, 0.0, 0.0], rot_speed)
+            if keys[pygame.K_f]:
+                rotate_object(obj, [1.0, 0.0, 0.0], -rot_speed)
+            if keys[pygame.K_t]:
+                rotate_object(obj, [0.0, 0.0, 1.0], rot_speed)
+            if keys[pygame.K_g]:
+                rotate_object(obj, [0.0, 0.0, 1.0], -rot_speed)
+            if keys[pygame.K_LEFT]:
+                obj.position[0] -= move
+            if keys[pygame.K_RIGHT]:
+                obj.position[0] += move
+            if keys[pygame.K_UP]:
+                obj.position[2] += move
+            if keys[pygame.K_DOWN]:
+                obj.position[2] -= move
+            if keys[pygame.K_PAGEUP]:
+                obj.position[1] += move
+            if keys[pygame.K_PAGEDOWN]:
+                obj.position[1] -= move
+
+        scene_asteroids.update(delta_time)
+
+        screen.fill(COLOR_BG)
+
+        # Ground grid, projected in one batch; consecutive pairs are segments.
+        # Segment visibility is one vectorized bounds check, not per-point
+        # Rect.collidepoint calls.
+        grid_xy, grid_ok = camera.project_points(grid_verts)
+        in_view = ((grid_xy[:, 0] >= 0) & (grid_xy[:, 0] < MAIN_VIEW_WIDTH)
+                   & (grid_xy[:, 1] >= 0) & (grid_xy[:, 1] < HEIGHT))
+        seg_ok = (grid_ok.reshape(-1, 2).all(axis=1)
+                  & in_view.reshape(-1, 2).any(axis=1))
+        for j in np.nonzero(seg_ok)[0]:
+            pygame.draw.line(screen, COLOR_GRID,
+                             grid_xy[2 * j], grid_xy[2 * j + 1], 1)
+
+        # Course boundary cube.
+        if boundary_cache[0] != boundary_size:
+            half = boundary_size / 2.0
+            boundary_cache = (boundary_size,
+                              np.array([[x, y, z]
+                                        for x in (-half, half)
+                                        for y in (-half, half)
+                                        for z in (-half, half)]))
+        boundary_verts = boundary_cache[1]
+        boundary_xy, boundary_ok = camera.project_points(boundary_verts)
+        for a, b in BOUNDARY_EDGES:
+            if boundary_ok[a] and boundary_ok[b]:
+                pygame.draw.line(screen, COLOR_BOUNDARY,
+                                 boundary_xy[a], boundary_xy[b], 1)
+
+        # Cull whole objects against the main view before projecting their
+        # vertices; with a large random field most asteroids are offscreen.
+        cam_forward = camera.target - camera.position
+        cam_forward = cam_forward / np.linalg.norm(cam_forward)
+        focal = 0.5 * MAIN_VIEW_WIDTH * camera._focal
+        for i, gate in enumerate(scene_gates):
+            p = camera.project_point(gate.position)
+            if not object_visible(camera, cam_forward, focal,
+                                  gate.position, gate.size, p):
+                continue
+            draw_gate(screen, camera, gate)
+            screen.blit(render_label(str(i + 1)), p)
+        for asteroid in scene_asteroids:
+            p = camera.project_point(asteroid.position)
+            if object_visible(camera, cam_forward, focal,
+                              asteroid.position, asteroid.size, p):
+                draw_asteroid(screen, camera, asteroid)
+
+        if selected is not None:
+            kind, index = selected
+            obj = scene_gates[index] if kind == 'gate' else scene_asteroids[index]
+            p = camera.project_point(obj.position)
+            if p is not None:
+                pygame.draw.circle(screen, COLOR_SELECTED, p, 12, 1)
+
+        # Sidebar.
+        pygame.draw.rect(screen, COLOR_SIDEBAR,
+                         (MAIN_VIEW_WIDTH, 0, SIDEBAR_WIDTH, HEIGHT))
+        sidebar_x = MAIN_VIEW_WIDTH + 10
+        screen.blit(render_label(f'File: {COURSE_FILE}'), (sidebar_x, 10))
+        screen.blit(render_label(f'Boundary: {boundary_size:.0f}'),
+                    (sidebar_x, 32))
+        screen.blit(render_label(f'Gates: {len(scene_gates)}'), (sidebar_x, 54))
+        screen.blit(render_label(f'Asteroids: {len(scene_asteroids)}'),
+                    (sidebar_x, 76))
+        if selected is not None:
+            screen.blit(
+                render_label(f'Selected: {selected[0]} {selected[1] + 1}',
+                             COLOR_SELECTED), (sidebar_x, 98))
+        help_lines = ['N: add gate', 'M: add asteroid', 'P: 50 random',
+                      'X/Del: delete', 'Q/E R/F T/G: rotate',
+                      'Arrows/PgUp/PgDn: move', 'S: save  L: load',
+                      '+/-: boundary size', 'RMB drag: orbit']
+        for k, line in enumerate(help_lines):
+            screen.blit(render_label(line), (sidebar_x, 140 + 20 * k))
+
+        if status_timer > 0.0:
+            status_timer -= delta_time
+            screen.blit(render_label(status_message), (sidebar_x, HEIGHT - 50))
+
+        pygame.display.flip()
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
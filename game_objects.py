@@ -0,0 +1,431 @@
+from collections import namedtuple
+
+import numpy as np
+
+from utils import mat_from_quat
+from utils_fast import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _count_hits(positions, sx, sy, sz, r2):
+    """Parallel squared-distance test; returns how many spheres overlap.
+
+    A count reduction instead of an early-out keeps the loop a valid
+    numba parallel reduction while SIMD lanes chew through the rows.
+    """
+    hits = 0
+    for i in prange(positions.shape[0]):
+        dx = positions[i, 0] - sx
+        dy = positions[i, 1] - sy
+        dz = positions[i, 2] - sz
+        if dx * dx + dy * dy + dz * dz < r2[i]:
+            hits += 1
+    return hits
+
+# Wireframe ship: nose at +Z with a rectangular base behind it.
+# Dimensions roughly match the README (30m long, 15m wide).
+SHIP_VERTICES = np.array([
+    [0.0, 0.0, 15.0],
+    [-7.5, -3.75, -15.0],
+    [7.5, -3.75, -15.0],
+    [7.5, 3.75, -15.0],
+    [-7.5, 3.75, -15.0],
+], dtype=np.float32)
+
+# Nose-to-base fan edges; the base itself is a closed loop drawn with a
+# single pygame.draw.lines call.
+SHIP_EDGES = np.array([(0, 1), (0, 2), (0, 3), (0, 4)], dtype=np.int32)
+
+SHIP_RADIUS = float(np.linalg.norm(SHIP_VERTICES, axis=1).max())
+
+SHIP_LOOPS = [np.array([1, 2, 3, 4], dtype=np.int32)]
+
+_CUBE_VERTICES = np.array([
+    [-1.0, -1.0, -1.0],
+    [1.0, -1.0, -1.0],
+    [1.0, 1.0, -1.0],
+    [-1.0, 1.0, -1.0],
+    [-1.0, -1.0, 1.0],
+    [1.0, -1.0, 1.0],
+    [1.0, 1.0, 1.0],
+    [-1.0, 1.0, 1.0],
+], dtype=np.float32)
+
+# The four pillars stay single edges; the two square faces are loops.
+_CUBE_EDGES = np.array([(0, 4), (1, 5), (2, 6), (3, 7)], dtype=np.int32)
+
+_CUBE_LOOPS = [np.array([0, 1, 2, 3], dtype=np.int32),
+               np.array([4, 5, 6, 7], dtype=np.int32)]
+
+_TETRA_VERTICES = np.array([
+    [1.0, 1.0, 1.0],
+    [1.0, -1.0, -1.0],
+    [-1.0, 1.0, -1.0],
+    [-1.0, -1.0, 1.0],
+], dtype=np.float32)
+
+_GATE_EDGES = np.zeros((0, 2), dtype=np.int32)
+
+_GATE_LOOPS = [np.array([0, 1, 2, 3], dtype=np.int32)]
+
+_TETRA_EDGES = np.array([(0, 3), (1, 3), (2, 3)], dtype=np.int32)
+
+_TETRA_LOOPS = [np.array([0, 1, 2], dtype=np.int32)]
+
+# One shared vertex/edge buffer per model; instances scale by their size
+# at draw time instead of keeping private copies. `loops` are closed
+# polyline runs batched into single pygame.draw.lines calls; `radius`
+# is the bounding-sphere radius of the unscaled vertices.
+Model = namedtuple('Model', ['base_vertices', 'edges', 'loops', 'radius'])
+
+
+def _model(vertices, edges, loops):
+    radius = float(np.linalg.norm(vertices, axis=1).max())
+    return Model(vertices, edges, loops, radius)
+
+
+ASTEROID_MODELS = {
+    'cube': _model(_CUBE_VERTICES, _CUBE_EDGES, _CUBE_LOOPS),
+    'tetra': _model(_TETRA_VERTICES, _TETRA_EDGES, _TETRA_LOOPS),
+}
+
+ASTEROID_MODEL_IDS = list(ASTEROID_MODELS)
+
+
+class AsteroidPool:
+    """Structure-of-arrays backing store for the asteroids in a scene.
+
+    Positions, orientations, sizes and angular velocities live in
+    contiguous arrays so per-frame work (integration, projection,
+    picking) can be vectorized in one pass; Asteroid objects are
+    lightweight views indexing into their pool row.
+    """
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.positions = np.zeros((capacity, 3))
+        self.orientations = np.zeros((capacity, 4))
+        self.sizes = np.zeros(capacity)
+        self.angular_velocities = np.zeros((capacity, 3))
+        self.asteroids = []
+        self.version = 0  # bumped whenever orientations change wholesale
+        self._pos32 = None
+
+    def positions_f32(self):
+        """float32 shadow of the positions for render/collision hot paths.
+
+        The integrator state stays float64; this copy is rebuilt when the
+        pool's population changes, which is the only way positions move
+        in-game (the designer edits rows in place and must not use it).
+        """
+        n = self.count
+        if self._pos32 is None or len(self._pos32) != n:
+            self._pos32 = self.positions[:n].astype(np.float32)
+        return self._pos32
+
+    def check_collision(self, center, r2):
+        """True when any asteroid sphere contains `center`.
+
+        r2 holds the squared per-asteroid crash radii (float32, one per
+        pool row); the test runs in the parallel compiled kernel.
+        """
+        if self.count == 0:
+            return False
+        return _count_hits(self.positions_f32(), np.float32(center[0]),
+                           np.float32(center[1]), np.float32(center[2]),
+                           r2) > 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.asteroids)
+
+    def __getitem__(self, index):
+        return self.asteroids[index]
+
+    def _ensure_capacity(self, needed):
+        capacity = len(self.sizes)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, shape in (('positions', (capacity, 3)),
+                            ('orientations', (capacity, 4)),
+                            ('sizes', (capacity,)),
+                            ('angular_velocities', (capacity, 3))):
+            grown = np.zeros(shape)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+
+    def add(self, position, size, orientation=None, angular_velocity=None,
+            model_id='cube'):
+        index = self.count
+        self._ensure_capacity(index + 1)
+        self.positions[index] = position
+        if orientation is None:
+            orientation = [1.0, 0.0, 0.0, 0.0]
+        self.orientations[index] = orientation
+        if angular_velocity is None:
+            angular_velocity = [0.0, 0.0, 0.0]
+        self.angular_velocities[index] = angular_velocity
+        self.count = index + 1
+        asteroid = Asteroid(self, index, size, model_id)
+        self.asteroids.append(asteroid)
+        return asteroid
+
+    def extend_random(self, n, field_size, rng=None):
+        """Scatter n random asteroids directly into the pool arrays.
+
+        All draws land in the shared buffers, so the Asteroid views built
+        at the end carry no per-object vector copies at all.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        start = self.count
+        self._ensure_capacity(start + n)
+        rows = slice(start, start + n)
+        half = field_size / 2.0
+        self.positions[rows] = rng.uniform(-half, half, (n, 3))
+        self.sizes[rows] = rng.uniform(100.0, 500.0, n)
+        axes = rng.uniform(-1.0, 1.0, (n, 3))
+        axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+        half_angles = rng.uniform(0.0, 2.0 * np.pi, n) * 0.5
+        quats = self.orientations[rows]
+        quats[:, 0] = np.cos(half_angles)
+        quats[:, 1:] = axes * np.sin(half_angles)[:, None]
+        self.angular_velocities[rows] = rng.random((n, 3)) * 0.1
+        model_ids = rng.choice(ASTEROID_MODEL_IDS, n)
+        self.count = start + n
+        views = [Asteroid(self, start + i, self.sizes[start + i], model_id)
+                 for i, model_id in enumerate(model_ids)]
+        self.asteroids.extend(views)
+        return views
+
+    def remove(self, index):
+        """Swap-pop row `index`, keeping the arrays dense."""
+        last = self.count - 1
+        if index != last:
+            self.positions[index] = self.positions[last]
+            self.orientations[index] = self.orientations[last]
+            self.sizes[index] = self.sizes[last]
+            self.angular_velocities[index] = self.angular_velocities[last]
+            moved = self.asteroids[last]
+            moved.index = index
+            moved._rot_mat = None
+            self.asteroids[index] = moved
+        self.asteroids.pop()
+        self.count = last
+
+    def update(self, delta_time):
+        """Integrate every orientation in one vectorized pass."""
+        n = self.count
+        if n == 0:
+            return
+        q = self.orientations[:n]
+        aw, ax, ay, az = q.T
+        bx, by, bz = self.angular_velocities[:n].T
+        # dq = 0.5 * q * (0, omega); the zero scalar part drops four terms
+        # of the full batched Hamilton product.
+        dw = -ax * bx - ay * by - az * bz
+        dx = aw * bx + ay * bz - az * by
+        dy = aw * by - ax * bz + az * bx
+        dz = aw * bz + ax * by - ay * bx
+        half_dt = 0.5 * delta_time
+        q[:, 0] += dw * half_dt
+        q[:, 1] += dx * half_dt
+        q[:, 2] += dy * half_dt
+        q[:, 3] += dz * half_dt
+        q /= np.linalg.norm(q, axis=1, keepdims=True)
+        self.version += 1
+
+
+class Asteroid:
+    """A tumbling wireframe obstacle: a view of one AsteroidPool row."""
+
+    def __init__(self, pool, index, size, model_id='cube'):
+        self.pool = pool
+        self.index = index
+        self.model_id = model_id
+        self._rot_mat = None
+        self._rot_version = -1
+        self.set_size(size)
+
+    @property
+    def position(self):
+        return self.pool.positions[self.index]
+
+    @position.setter
+    def position(self, value):
+        self.pool.positions[self.index] = value
+
+    @property
+    def orientation(self):
+        return self.pool.orientations[self.index]
+
+    @orientation.setter
+    def orientation(self, value):
+        self.pool.orientations[self.index] = value
+        self._rot_mat = None
+
+    def get_rot_matrix(self):
+        """Cached quat-to-matrix; recomputed when the orientation moves."""
+        if self._rot_mat is None or self._rot_version != self.pool.version:
+            self._rot_mat = mat_from_quat(self.orientation)
+            self._rot_version = self.pool.version
+        return self._rot_mat
+
+    @property
+    def bounding_radius(self):
+        return self.model.radius * self.size / 2.0
+
+    @property
+    def angular_velocity(self):
+        return self.pool.angular_velocities[self.index]
+
+    @angular_velocity.setter
+    def angular_velocity(self, value):
+        self.pool.angular_velocities[self.index] = value
+
+    @property
+    def size(self):
+        return self.pool.sizes[self.index]
+
+    def set_size(self, size):
+        self.pool.sizes[self.index] = float(size)
+
+    @property
+    def model(self):
+        return ASTEROID_MODELS[self.model_id]
+
+
+class GatePool:
+    """Structure-of-arrays backing store for the gates of a course.
+
+    Same layout idea as AsteroidPool: positions, orientations, sizes and
+    the is_passed mask live in contiguous arrays so per-frame checks and
+    draw-state partitioning can be vectorized; Gate objects are views.
+    """
+
+    def __init__(self, capacity=16):
+        self.count = 0
+        self.positions = np.zeros((capacity, 3))
+        self.orientations = np.zeros((capacity, 4))
+        self.sizes = np.zeros(capacity)
+        self.is_passed = np.zeros(capacity, dtype=bool)
+        self.gates = []
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.gates)
+
+    def __getitem__(self, index):
+        return self.gates[index]
+
+    def _ensure_capacity(self, needed):
+        capacity = len(self.sizes)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, shape, dtype in (('positions', (capacity, 3), float),
+                                   ('orientations', (capacity, 4), float),
+                                   ('sizes', (capacity,), float),
+                                   ('is_passed', (capacity,), bool)):
+            grown = np.zeros(shape, dtype=dtype)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+
+    def add(self, position, size=300.0, orientation=None, is_passed=False):
+        index = self.count
+        self._ensure_capacity(index + 1)
+        self.positions[index] = position
+        if orientation is None:
+            orientation = [1.0, 0.0, 0.0, 0.0]
+        self.orientations[index] = orientation
+        self.is_passed[index] = is_passed
+        self.count = index + 1
+        gate = Gate(self, index, size)
+        self.gates.append(gate)
+        return gate
+
+    def remove(self, index):
+        """Swap-pop row `index`, keeping the arrays dense."""
+        last = self.count - 1
+        if index != last:
+            self.positions[index] = self.positions[last]
+            self.orientations[index] = self.orientations[last]
+            self.sizes[index] = self.sizes[last]
+            self.is_passed[index] = self.is_passed[last]
+            moved = self.gates[last]
+            moved.index = index
+            moved._rot_mat = None
+            self.gates[index] = moved
+        self.gates.pop()
+        self.count = last
+
+    def reset_passed(self):
+        self.is_passed[:self.count] = False
+
+
+class Gate:
+    """A square frame the ship has to fly through: a GatePool row view."""
+
+    def __init__(self, pool, index, size=300.0):
+        self.pool = pool
+        self.index = index
+        self._rot_mat = None
+        self.set_size(size)
+
+    @property
+    def position(self):
+        return self.pool.positions[self.index]
+
+    @position.setter
+    def position(self, value):
+        self.pool.positions[self.index] = value
+
+    @property
+    def orientation(self):
+        return self.pool.orientations[self.index]
+
+    @orientation.setter
+    def orientation(self, value):
+        self.pool.orientations[self.index] = value
+        self._rot_mat = None
+
+    def get_rot_matrix(self):
+        """Cached quat-to-matrix; static gates compute it exactly once."""
+        if self._rot_mat is None:
+            self._rot_mat = mat_from_quat(self.orientation)
+        return self._rot_mat
+
+    @property
+    def bounding_radius(self):
+        return self.size * 0.7071067811865476  # corner of the square frame
+
+    @property
+    def size(self):
+        return self.pool.sizes[self.index]
+
+    @property
+    def is_passed(self):
+        return self.pool.is_passed[self.index]
+
+    @is_passed.setter
+    def is_passed(self, value):
+        self.pool.is_passed[self.index] = value
+
+    def set_size(self, size):
+        self.pool.sizes[self.index] = float(size)
+        half = float(size) / 2.0
+        self.vertices = np.array([
+            [-half, -half, 0.0],
+            [half, -half, 0.0],
+            [half, half, 0.0],
+            [-half, half, 0.0],
+        ], dtype=np.float32)
+        self.edges = _GATE_EDGES
+        self.loops = _GATE_LOOPS
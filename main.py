@@ -0,0 +1,75 @@
+import math
+
+import pygame
+
+from physics_numpy import Spaceship
+from renderer import COLOR_BG, Camera, draw_ship, draw_text
+from settings import load_settings
+
+
+def main():
+    settings = load_settings()
+
+    pygame.init()
+    flags = pygame.FULLSCREEN if settings.fullscreen else 0
+    screen = pygame.display.set_mode(
+        (settings.screen_width, settings.screen_height), flags)
+    pygame.display.set_caption('Space Race')
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont('consolas', 18)
+
+    ship = Spaceship(settings.ship_weight, settings.starting_vector)
+    camera = Camera(settings.screen_width, settings.screen_height)
+
+    # Input-handler constants, computed once outside the loop.
+    steer = settings.max_steering_thruster * 50.0
+    thrust_fwd = settings.max_thruster
+    thrust_rev = -settings.max_reverse_thruster
+
+    # Key->action table: each frame builds a bitmask of pressed keys and
+    # walks only the set bits instead of running the whole if-chain.
+    key_table = [
+        (pygame.K_w, lambda: ship.apply_force_z(thrust_fwd, local=True)),
+        (pygame.K_s, lambda: ship.apply_force_z(thrust_rev, local=True)),
+        (pygame.K_LEFT, lambda: ship.apply_torque_xyz(0.0, steer, 0.0)),
+        (pygame.K_RIGHT, lambda: ship.apply_torque_xyz(0.0, -steer, 0.0)),
+        (pygame.K_UP, lambda: ship.apply_torque_xyz(steer, 0.0, 0.0)),
+        (pygame.K_DOWN, lambda: ship.apply_torque_xyz(-steer, 0.0, 0.0)),
+        (pygame.K_q, lambda: ship.apply_torque_xyz(0.0, 0.0, steer)),
+        (pygame.K_e, lambda: ship.apply_torque_xyz(0.0, 0.0, -steer)),
+    ]
+
+    running = True
+    while running:
+        delta_time = clock.tick(settings.fps) / 1000.0
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                running = False
+
+        keys = pygame.key.get_pressed()
+        mask = 0
+        for bit, (key, _) in enumerate(key_table):
+            mask |= keys[key] << bit
+        while mask:
+            bit = (mask & -mask).bit_length() - 1
+            key_table[bit][1]()
+            mask &= mask - 1
+
+        ship.update(delta_time)
+        camera.update(ship)
+
+        screen.fill(COLOR_BG)
+        draw_ship(screen, camera, ship)
+        speed = math.sqrt(ship.velocity @ ship.velocity)
+        draw_text(screen, font, f'{settings.player_name}  speed: {speed:.1f} m/s',
+                  (10, 10))
+        pygame.display.flip()
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+import math
+
+import ijson
+import numpy as np
+import pygame
+from scipy.spatial import cKDTree
+
+from game_objects import AsteroidPool, GatePool
+from physics_numpy import Spaceship
+from renderer import (COLOR_BG, COLOR_TEXT, Camera, WireframeBatch,
+                      draw_text)
+from settings import load_joystick_settings, load_settings
+
+
+def reset_game_state(settings):
+    """Fresh ship and course for a new run."""
+    scene_gates = GatePool()
+    scene_asteroids = AsteroidPool()
+    with open('course.json', 'rb') as f:
+        for data in ijson.items(f, 'gates.item', use_float=True):
+            scene_gates.add(**data)
+    with open('course.json', 'rb') as f:
+        for data in ijson.items(f, 'asteroids.item', use_float=True):
+            scene_asteroids.add(**data)
+    ship = Spaceship(settings.ship_weight, settings.starting_vector)
+    return ship, scene_gates, scene_asteroids
+
+
+def build_broad_phase(asteroids, ship_radius):
+    """Squared crash radii plus a kd-tree over the asteroid centers."""
+    n = len(asteroids)
+    if n == 0:
+        return None, None, 0.0
+    radii = asteroids.sizes[:n] / 2.0 + ship_radius
+    tree = cKDTree(asteroids.positions[:n])
+    return radii ** 2, tree, float(radii.max())
+
+
+def main():
+    settings = load_settings()
+
+    pygame.init()
+    pygame.joystick.init()
+    flags = pygame.FULLSCREEN if settings.fullscreen else 0
+    screen = pygame.display.set_mode(
+        (settings.screen_width, settings.screen_height), flags)
+    pygame.display.set_caption('Space Race')
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont('consolas', 18)
+
+    joystick = None
+    joy_settings = None
+    if pygame.joystick.get_count() > 0:
+        # Only now is the [Joystick] config section parsed at all.
+        joy_settings = load_joystick_settings()
+        if joy_settings.enabled:
+            joystick = pygame.joystick.Joystick(joy_settings.joystick_id)
+            joystick.init()
+
+    ship, scene_gates, scene_asteroids = reset_game_state(settings)
+    ship_radius = settings.ship_length / 2.0
+    # Broad-phase structures, built once per course load: asteroid
+    # positions are static, only their orientations tumble.
+    ast_r2, ast_tree, ast_reach = build_broad_phase(scene_asteroids, ship_radius)
+    camera = Camera(settings.screen_width, settings.screen_height)
+    batch = WireframeBatch()
+
+    # Input-handler constants, computed once outside the loop.
+    steer = settings.max_steering_thruster * 50.0
+    thrust_fwd = settings.max_thruster
+    thrust_rev = -settings.max_reverse_thruster
+    current_gate_index = 0
+    game_over = False
+    won = False
+
+    # Key->action table: each frame builds a bitmask of pressed keys and
+    # walks only the set bits instead of running the whole if-chain.
+    key_table = [
+        (pygame.K_w, lambda: ship.apply_force_z(thrust_fwd, local=True)),
+        (pygame.K_s, lambda: ship.apply_force_z(thrust_rev, local=True)),
+        (pygame.K_LEFT, lambda: ship.apply_torque_xyz(0.0, steer, 0.0)),
+        (pygame.K_RIGHT, lambda: ship.apply_torque_xyz(0.0, -steer, 0.0)),
+        (pygame.K_UP, lambda: ship.apply_torque_xyz(steer, 0.0, 0.0)),
+        (pygame.K_DOWN, lambda: ship.apply_torque_xyz(-steer, 0.0, 0.0)),
+        (pygame.K_q, lambda: ship.apply_torque_xyz(0.0, 0.0, steer)),
+        (pygame.K_e, lambda: ship.apply_torque_xyz(0.0, 0.0, -steer)),
+    ]
+
+    running = True
+    while running:
+        delta_time = clock.tick(settings.fps) / 1000.0
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_RETURN and game_over:
+                    ship, scene_gates, scene_asteroids = reset_game_state(settings)
+                    ast_r2, ast_tree, ast_reach = \
+                        build_broad_phase(scene_asteroids, ship_radius)
+                    current_gate_index = 0
+                    game_over = False
+                    won = False
+
+        if not game_over:
+            keys = pygame.key.get_pressed()
+            mask = 0
+            for bit, (key, _) in enumerate(key_table):
+                mask |= keys[key] << bit
+            while mask:
+                bit = (mask & -mask).bit_length() - 1
+                key_table[bit][1]()
+                mask &= mask - 1
+
+            if joystick is not None:
+                # Branchless deadzone: filter all four axes in one
+                # vectorized pass instead of four jittery ifs.
+                deadzone = joy_settings.deadzone
+                axes = np.array([joystick.get_axis(joy_settings.axis_yaw),
+                                 joystick.get_axis(joy_settings.axis_pitch),
+                                 joystick.get_axis(joy_settings.axis_roll),
+                                 -joystick.get_axis(joy_settings.axis_thrust)])
+                mag = np.abs(axes)
+                scaled = np.where(mag > deadzone,
+                                  np.sign(axes) * (mag - deadzone)
+                                  / (1.0 - deadzone), 0.0)
+                ship.apply_torque_xyz(-scaled[1] * steer, -scaled[0] * steer,
+                                      -scaled[2] * steer)
+                ship.apply_force_z(scaled[3] * thrust_fwd, local=True)
+
+            ship.update(delta_time)
+
+            scene_asteroids.update(delta_time)
+            if ast_tree is not None:
+                # Broad phase: the kd-tree prunes to the handful of
+                # asteroids within reach before the exact squared test.
+                for idx in ast_tree.query_ball_point(ship.position, ast_reach):
+                    diff = scene_asteroids.positions[idx] - ship.position
+                    if diff @ diff < ast_r2[idx]:
+                        game_over = True
+                        break
+
+            if current_gate_index < len(scene_gates):
+                target_gate = scene_gates[current_gate_index]
+                gate_diff = ship.position - target_gate.position
+                if gate_diff @ gate_diff < (target_gate.size / 2.0) ** 2:
+                    target_gate.is_passed = True
+                    current_gate_index += 1
+                    if current_gate_index == len(scene_gates):
+                        game_over = True
+                        won = True
+
+        camera.update(ship)
+
+        screen.fill(COLOR_BG)
+        batch.begin_frame()
+        batch.submit_gates(scene_gates)
+        for asteroid in scene_asteroids:
+            batch.submit_asteroid(asteroid)
+        batch.submit_ship(ship)
+        batch.flush(screen, camera)
+
+        hud_text = f'Next Gate: {current_gate_index + 1} / {len(scene_gates)}'
+        if won:
+            hud_text = 'Course complete! Enter to restart'
+        elif game_over:
+            hud_text = 'CRASHED - Enter to restart'
+        draw_text(screen, font, hud_text, (10, 10))
+        speed = math.sqrt(ship.velocity @ ship.velocity)
+        draw_text(screen, font, f'Speed: {speed:.1f} m/s', (10, 32))
+
+        # Velocity direction indicator: project velocity onto the screen plane.
+        vel_dir_2d = np.array([ship.velocity[0], -ship.velocity[1]])
+        vel_norm = math.sqrt(vel_dir_2d @ vel_dir_2d)
+        if vel_norm > 1.0:
+            vel_dir_2d /= vel_norm
+            cx = settings.screen_width // 2
+            cy = settings.screen_height // 2
+            tip = (cx + int(vel_dir_2d[0] * 40), cy + int(vel_dir_2d[1] * 40))
+            pygame.draw.line(screen, COLOR_TEXT, (cx, cy), tip, 1)
+
+        pygame.display.flip()
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
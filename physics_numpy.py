@@ -0,0 +1,146 @@
+import math
+
+import numpy as np
+
+from utils_fast import njit
+
+
+@njit(cache=True, fastmath=True)
+def _integrate(state, force, torque, inertia, mass, dt, renormalize):
+    """Fused rigid-body step over a packed state vector.
+
+    state layout: position[0:3], velocity[3:6], orientation[6:10],
+    angular_velocity[10:13]. Forces and torques are cleared on exit.
+
+    Orientation advances by the closed-form exponential map
+    dq = exp(0.5*omega*dt), which stays unit length to rounding error,
+    so callers only need to renormalize every few dozen frames.
+    """
+    for i in range(3):
+        state[3 + i] += force[i] * dt / mass
+        state[i] += state[3 + i] * dt
+        state[10 + i] += torque[i] / inertia[i] * dt
+        force[i] = 0.0
+        torque[i] = 0.0
+    hx = state[10] * 0.5 * dt
+    hy = state[11] * 0.5 * dt
+    hz = state[12] * 0.5 * dt
+    theta = math.sqrt(hx * hx + hy * hy + hz * hz)
+    if theta < 1e-8:
+        dw, dx, dy, dz = 1.0, hx, hy, hz
+    else:
+        s = math.sin(theta) / theta
+        dw, dx, dy, dz = math.cos(theta), s * hx, s * hy, s * hz
+    w, x, y, z = state[6], state[7], state[8], state[9]
+    nw = w * dw - x * dx - y * dy - z * dz
+    nx = w * dx + x * dw + y * dz - z * dy
+    ny = w * dy - x * dz + y * dw + z * dx
+    nz = w * dz + x * dy - y * dx + z * dw
+    if renormalize:
+        inv = 1.0 / math.sqrt(nw * nw + nx * nx + ny * ny + nz * nz)
+        nw *= inv
+        nx *= inv
+        ny *= inv
+        nz *= inv
+    state[6] = nw
+    state[7] = nx
+    state[8] = ny
+    state[9] = nz
+
+
+class Spaceship:
+    """Rigid-body flight model with quaternion orientation.
+
+    The whole state lives in one packed float64 buffer so the integrator
+    is a single compiled kernel call; position/velocity/orientation are
+    views into it.
+    """
+
+    def __init__(self, mass, position, inertia=None):
+        self.mass = float(mass)
+        self._state = np.zeros(13)
+        self._state[0:3] = position
+        self._state[6] = 1.0
+        self.position = self._state[0:3]
+        self.velocity = self._state[3:6]
+        self.orientation = self._state[6:10]
+        self.angular_velocity = self._state[10:13]
+        if inertia is None:
+            # Crude box inertia from the README dimensions.
+            inertia = [self.mass * 75.0, self.mass * 90.0, self.mass * 25.0]
+        self.inertia = np.array(inertia, dtype=float)
+        self.total_force = np.zeros(3)
+        self.total_torque = np.zeros(3)
+        self._frame = 0
+        # Lazily cached rotation matrix; _rot_q remembers which quaternion
+        # it was built from.
+        self._rot_mat = np.empty((3, 3))
+        self._rot_q = np.zeros(4)
+
+    def _rotation_matrix(self):
+        """Rotation matrix for the current orientation, rebuilt on change.
+
+        Columns are the rotated x/y/z basis vectors, so rotating a basis
+        vector is a column read and rotating any vector one matvec instead
+        of two quaternion multiplies.
+        """
+        q = self.orientation
+        if not np.array_equal(q, self._rot_q):
+            self._rot_q[:] = q
+            w, x, y, z = q
+            xx, yy, zz = x * x, y * y, z * z
+            xy, xz, yz = x * y, x * z, y * z
+            wx, wy, wz = w * x, w * y, w * z
+            mat = self._rot_mat
+            mat[0, 0] = 1.0 - 2.0 * (yy + zz)
+            mat[0, 1] = 2.0 * (xy - wz)
+            mat[0, 2] = 2.0 * (xz + wy)
+            mat[1, 0] = 2.0 * (xy + wz)
+            mat[1, 1] = 1.0 - 2.0 * (xx + zz)
+            mat[1, 2] = 2.0 * (yz - wx)
+            mat[2, 0] = 2.0 * (xz - wy)
+            mat[2, 1] = 2.0 * (yz + wx)
+            mat[2, 2] = 1.0 - 2.0 * (xx + yy)
+        return self._rot_mat
+
+    def apply_force(self, force, local_space=False):
+        if local_space:
+            force = self._rotation_matrix() @ force
+        self.total_force += force
+
+    def apply_force_z(self, thrust, local=False):
+        """Thrust along the (local or world) z axis without building arrays."""
+        if local:
+            mat = self._rotation_matrix()
+            self.total_force[0] += mat[0, 2] * thrust
+            self.total_force[1] += mat[1, 2] * thrust
+            self.total_force[2] += mat[2, 2] * thrust
+        else:
+            self.total_force[2] += thrust
+
+    def apply_torque(self, torque):
+        self.total_torque += torque
+
+    def apply_torque_xyz(self, tx, ty, tz):
+        self.total_torque[0] += tx
+        self.total_torque[1] += ty
+        self.total_torque[2] += tz
+
+    def get_rot_matrix(self):
+        """Public accessor for the cached orientation matrix."""
+        return self._rotation_matrix()
+
+    def get_forward_vector(self):
+        return self._rotation_matrix()[:, 2]
+
+    def get_up_vector(self):
+        return self._rotation_matrix()[:, 1]
+
+    def get_right_vector(self):
+        return self._rotation_matrix()[:, 0]
+
+    def update(self, delta_time):
+        self._frame += 1
+        _integrate(self._state, self.total_force, self.total_torque,
+                   self.inertia, self.mass, delta_time,
+                   self._frame % 32 == 0)
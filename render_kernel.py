@@ -0,0 +1,34 @@
+"""Compiled rotate+project kernel for the wireframe draw path.
+
+One call transforms an object's whole vertex array: rotation by the
+object's (cached) 3x3 matrix, translation, camera-space transform,
+near-plane clip and screen mapping all happen in a single scalar loop
+that numba turns into machine code, with results written into
+caller-owned buffers. The matrix form costs 9 multiplies per vertex
+against ~18 for the quaternion rotation it replaced.
+"""
+
+from utils_fast import njit
+
+
+@njit(cache=True, fastmath=True)
+def project_wireframe(V, R, px, py, pz, cx, cy, cz,
+                      right, up, forward, tan_half, near, width, height,
+                      xy, mask):
+    for i in range(V.shape[0]):
+        vx, vy, vz = V[i, 0], V[i, 1], V[i, 2]
+        wx = R[0, 0] * vx + R[0, 1] * vy + R[0, 2] * vz + px - cx
+        wy = R[1, 0] * vx + R[1, 1] * vy + R[1, 2] * vz + py - cy
+        wz = R[2, 0] * vx + R[2, 1] * vy + R[2, 2] * vz + pz - cz
+        z = wx * forward[0] + wy * forward[1] + wz * forward[2]
+        if z < near:
+            xy[i, 0] = 0
+            xy[i, 1] = 0
+            mask[i] = False
+            continue
+        scale = 1.0 / (tan_half * z)
+        x = wx * right[0] + wy * right[1] + wz * right[2]
+        y = wx * up[0] + wy * up[1] + wz * up[2]
+        xy[i, 0] = int((1.0 + x * scale) * 0.5 * width)
+        xy[i, 1] = int((1.0 - y * scale) * 0.5 * height)
+        mask[i] = True
@@ -0,0 +1,308 @@
+import functools
+import math
+
+import numpy as np
+import pygame
+
+from game_objects import SHIP_EDGES, SHIP_LOOPS, SHIP_RADIUS, SHIP_VERTICES
+from render_kernel import project_wireframe
+
+COLOR_BG = (5, 5, 15)
+COLOR_SHIP = (180, 220, 255)
+COLOR_ASTEROID = (150, 120, 90)
+COLOR_GATE = (80, 255, 120)
+COLOR_GATE_PASSED = (60, 90, 70)
+COLOR_TEXT = (220, 220, 220)
+
+
+class Camera:
+    """Simple look-at perspective camera."""
+
+    def __init__(self, width, height, position=None, fov=70.0, near_plane=0.1,
+                 far_plane=100000.0):
+        self.width = width
+        self.height = height
+        self.far_plane = far_plane
+        self._basis_dirty = True
+        if position is None:
+            position = [0.0, 0.0, -100.0]
+        self.position = np.array(position, dtype=float)
+        self.target = np.zeros(3)
+        self.up = np.array([0.0, 1.0, 0.0])
+        self.fov = fov
+        self.near_plane = near_plane
+
+    # fov is effectively constant, so the derived tan/focal terms are
+    # computed on assignment rather than per projected point.
+    @property
+    def fov(self):
+        return self._fov
+
+    @fov.setter
+    def fov(self, value):
+        self._fov = value
+        self._tan_half_fov = math.tan(math.radians(value) / 2.0)
+        self._focal = 1.0 / self._tan_half_fov
+
+    # The camera basis only changes when position/target/up are assigned,
+    # not once per projected vertex: cache it behind a dirty flag.
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = np.asarray(value, dtype=float)
+        self._basis_dirty = True
+
+    @property
+    def target(self):
+        return self._target
+
+    @target.setter
+    def target(self, value):
+        self._target = np.asarray(value, dtype=float)
+        self._basis_dirty = True
+
+    @property
+    def up(self):
+        return self._up
+
+    @up.setter
+    def up(self, value):
+        self._up = np.asarray(value, dtype=float)
+        self._basis_dirty = True
+
+    def _basis(self):
+        if self._basis_dirty:
+            forward = self._target - self._position
+            forward = forward / math.sqrt(forward @ forward)
+            right = np.cross(forward, self._up)
+            right = right / math.sqrt(right @ right)
+            camera_up = np.cross(right, forward)
+            camera_up = camera_up / math.sqrt(camera_up @ camera_up)
+            self._forward = forward
+            self._right = right
+            self._cam_up = camera_up
+            self._basis_dirty = False
+        return self._right, self._cam_up, self._forward
+
+    def update(self, ship):
+        """Chase-camera: sit behind and above the ship, look past its nose."""
+        forward = ship.get_forward_vector()
+        up = ship.get_up_vector()
+        self.position = ship.position - forward * 100.0 + up * 30.0
+        self.target = ship.position + forward * 200.0
+        self.up = up
+
+    def project_point(self, point):
+        """Project a world-space point to screen pixels, or None if behind."""
+        right, camera_up, forward = self._basis()
+        rel = point - self.position
+        p_camera_z = rel @ forward
+        if p_camera_z < self.near_plane:
+            return None
+
+        scale = self._focal / p_camera_z
+        x_screen = int((1.0 + (rel @ right) * scale) * 0.5 * self.width)
+        y_screen = int((1.0 - (rel @ camera_up) * scale) * 0.5 * self.height)
+        return (x_screen, y_screen)
+
+    def project_points(self, points):
+        """Project an (N, 3) array of world points in one vectorized pass.
+
+        Returns (xy, valid): xy is an (N, 2) int32 array of screen coords,
+        valid a boolean mask of points in front of the near plane. Rows
+        where valid is False hold garbage and must not be drawn.
+        """
+        right, camera_up, forward = self._basis()
+        rel = points - self.position
+        # Depth first: rows behind the near plane skip the remaining two
+        # dot products entirely.
+        z = rel @ forward
+        valid = z >= self.near_plane
+        xy = np.empty((len(points), 2), dtype=np.int32)
+        if valid.any():
+            vis = rel[valid]
+            scale = self._focal / z[valid]
+            xy[valid, 0] = (1.0 + (vis @ right) * scale) * 0.5 * self.width
+            xy[valid, 1] = (1.0 - (vis @ camera_up) * scale) * 0.5 * self.height
+        return xy, valid
+
+
+def _draw_segments(screen, color, edges, loops, xy, ok):
+    """Draw projected edges plus closed polyline loops.
+
+    A fully visible loop goes out as one pygame.draw.lines call; loops
+    with hidden vertices fall back to per-edge lines.
+    """
+    valid = ok[edges[:, 0]] & ok[edges[:, 1]]
+    for k in np.nonzero(valid)[0]:
+        pygame.draw.line(screen, color, xy[edges[k, 0]], xy[edges[k, 1]], 1)
+    for loop in loops:
+        if ok[loop].all():
+            pygame.draw.lines(screen, color, True, xy[loop], 1)
+        else:
+            nxt = np.roll(loop, -1)
+            seg_ok = ok[loop] & ok[nxt]
+            for k in np.nonzero(seg_ok)[0]:
+                pygame.draw.line(screen, color, xy[loop[k]], xy[nxt[k]], 1)
+
+
+# Scratch buffers for draw_wireframe_object, grown to the largest vertex
+# count seen; the kernel writes into them so no per-call arrays are built.
+_xy = np.empty((64, 2), dtype=np.int32)
+_mask = np.empty(64, dtype=np.bool_)
+
+
+def draw_wireframe_object(screen, camera, vertices, edges, position, rot_mat,
+                          color, loops=()):
+    global _xy, _mask
+    n = len(vertices)
+    if n > len(_xy):
+        _xy = np.empty((n, 2), dtype=np.int32)
+        _mask = np.empty(n, dtype=np.bool_)
+    right, camera_up, forward = camera._basis()
+    project_wireframe(vertices, rot_mat, position[0],
+                      position[1], position[2], camera.position[0],
+                      camera.position[1], camera.position[2], right,
+                      camera_up, forward, camera._tan_half_fov,
+                      camera.near_plane, camera.width, camera.height,
+                      _xy, _mask)
+    _draw_segments(screen, color, edges, loops, _xy, _mask)
+
+
+class WireframeBatch:
+    """Collects a frame's wireframes and projects them all in one call.
+
+    submit() records each object with its (cached) rotation matrix;
+    flush() folds that matrix and the camera transform into one affine
+    per object, runs a single matmul per vertex array straight into
+    camera space, perspective-divides the whole frame at once, then
+    draws edges object by object.
+    """
+
+    def __init__(self):
+        self._items = []
+
+    def begin_frame(self):
+        self._items.clear()
+
+    def submit(self, vertices, edges, position, rot_mat, color, loops=(),
+               radius=np.inf):
+        self._items.append((vertices, edges, position, rot_mat, color,
+                            loops, radius))
+
+    def submit_ship(self, ship):
+        self.submit(SHIP_VERTICES, SHIP_EDGES, ship.position,
+                    ship.get_rot_matrix(), COLOR_SHIP, SHIP_LOOPS,
+                    SHIP_RADIUS)
+
+    def submit_asteroid(self, asteroid):
+        model = asteroid.model
+        self.submit(model.base_vertices * (float(asteroid.size) / 2.0),
+                    model.edges, asteroid.position,
+                    asteroid.get_rot_matrix(), COLOR_ASTEROID, model.loops,
+                    asteroid.bounding_radius)
+
+    def submit_gate(self, gate):
+        color = COLOR_GATE_PASSED if gate.is_passed else COLOR_GATE
+        self.submit(gate.vertices, gate.edges, gate.position,
+                    gate.get_rot_matrix(), color, gate.loops,
+                    gate.bounding_radius)
+
+    def submit_gates(self, gates):
+        """Submit a whole GatePool partitioned by its is_passed mask.
+
+        Active gates go in one run, passed gates in another, so the
+        draw color changes twice per frame instead of per gate.
+        """
+        mask = gates.is_passed[:len(gates)]
+        for color, indices in ((COLOR_GATE, np.nonzero(~mask)[0]),
+                               (COLOR_GATE_PASSED, np.nonzero(mask)[0])):
+            for i in indices:
+                gate = gates[i]
+                self.submit(gate.vertices, gate.edges, gate.position,
+                            gate.get_rot_matrix(), color, gate.loops,
+                            gate.bounding_radius)
+
+    def flush(self, screen, camera):
+        items = self._items
+        if not items:
+            return
+        right, camera_up, forward = camera._basis()
+        cam_rot = np.stack((right, camera_up, forward))
+        cam_pos = camera.position
+        # Bounding-sphere frustum reject: one dot product can skip an
+        # object's whole transform+projection.
+        near = camera.near_plane
+        far = camera.far_plane
+        items = [item for item in items
+                 if near - item[6]
+                 <= (item[2] - cam_pos) @ forward <= far + item[6]]
+        if not items:
+            self._items.clear()
+            return
+        counts = np.array([len(item[0]) for item in items])
+        total = int(counts.sum())
+        # Camera-space coordinates in float32: the geometry buffers are
+        # float32 already, so the per-object matmul runs through sgemm
+        # with half the memory traffic of the float64 path.
+        cam = np.empty((total, 3), dtype=np.float32)
+        offset = 0
+        # Associativity: object rotation and the camera transform fold
+        # into one affine per object, so each vertex array takes a single
+        # matmul straight into camera space.
+        for vertices, _, position, rot_mat, _, _, _ in items:
+            n = len(vertices)
+            affine = (cam_rot @ rot_mat).astype(np.float32)
+            translation = (cam_rot @ (position - cam_pos)).astype(np.float32)
+            cam[offset:offset + n] = vertices @ affine.T + translation
+            offset += n
+        z = cam[:, 2]
+        ok = z >= camera.near_plane
+        xy = np.empty((total, 2), dtype=np.int32)
+        if ok.any():
+            scale = camera._focal / z[ok]
+            xy[ok, 0] = (1.0 + cam[ok, 0] * scale) * 0.5 * camera.width
+            xy[ok, 1] = (1.0 - cam[ok, 1] * scale) * 0.5 * camera.height
+        offset = 0
+        for (_, edges, _, _, color, loops, _), n in zip(items, counts):
+            _draw_segments(screen, color, edges, loops,
+                           xy[offset:offset + n], ok[offset:offset + n])
+            offset += n
+        self._items.clear()
+
+
+def draw_ship(screen, camera, ship):
+    draw_wireframe_object(screen, camera, SHIP_VERTICES, SHIP_EDGES,
+                          ship.position, ship.get_rot_matrix(), COLOR_SHIP,
+                          SHIP_LOOPS)
+
+
+def draw_asteroid(screen, camera, asteroid):
+    model = asteroid.model
+    # float(size) keeps the scaled copy float32 like the base vertices.
+    draw_wireframe_object(screen, camera,
+                          model.base_vertices * (float(asteroid.size) / 2.0),
+                          model.edges, asteroid.position,
+                          asteroid.get_rot_matrix(), COLOR_ASTEROID,
+                          model.loops)
+
+
+def draw_gate(screen, camera, gate):
+    color = COLOR_GATE_PASSED if gate.is_passed else COLOR_GATE
+    draw_wireframe_object(screen, camera, gate.vertices, gate.edges,
+                          gate.position, gate.get_rot_matrix(), color,
+                          gate.loops)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_text(font, text, color):
+    # font.render is pure in (font, text, color), and the HUD repeats the
+    # same few strings for many frames - rasterize each one once.
+    return font.render(text, True, color)
+
+
+def draw_text(screen, font, text, pos, color=COLOR_TEXT):
+    screen.blit(_render_text(font, text, color), pos)
@@ -0,0 +1,52 @@
+"""Experimental GPU-backed wireframe renderer on pygame._sdl2.
+
+Opt-in alternative to the Surface pipeline in renderer.py: create a
+WireframeRenderer instead of a display Surface and pass it the same
+vertex/edge data. Lines go through SDL_Renderer's accelerated
+draw_line instead of the CPU pygame.draw path.
+
+pygame does not (yet) expose SDL_RenderGeometry, so each edge is still
+one draw_line call — but that call is a thin C wrapper over the GPU
+renderer and the coordinate preparation stays vectorized in numpy.
+When render_geometry lands upstream the flush loop below is the one
+place to swap.
+"""
+
+import numpy as np
+from pygame._sdl2.video import Renderer, Window
+
+
+class WireframeRenderer:
+    """Batches wireframe edges and draws them through SDL_Renderer."""
+
+    def __init__(self, title, width, height):
+        self.window = Window(title, size=(width, height))
+        self.renderer = Renderer(self.window)
+
+    def clear(self, color):
+        self.renderer.draw_color = (*color, 255)
+        self.renderer.clear()
+
+    def draw_wireframe(self, camera, vertices, edges, position, rot_mat,
+                       color, loops=()):
+        """Same contract as renderer.draw_wireframe_object.
+
+        SDL_Renderer has no polyline call, so closed loops are emitted
+        as per-edge draw_line pairs; the batching still happens on the
+        SDL side.
+        """
+        world_vertices = vertices @ rot_mat.T + position
+        xy, ok = camera.project_points(world_vertices)
+        draw_line = self.renderer.draw_line
+        self.renderer.draw_color = (*color, 255)
+        valid = ok[edges[:, 0]] & ok[edges[:, 1]]
+        for k in np.nonzero(valid)[0]:
+            draw_line(xy[edges[k, 0]], xy[edges[k, 1]])
+        for loop in loops:
+            nxt = np.roll(loop, -1)
+            seg_ok = ok[loop] & ok[nxt]
+            for k in np.nonzero(seg_ok)[0]:
+                draw_line(xy[loop[k]], xy[nxt[k]])
+
+    def present(self):
+        self.renderer.present()
@@ -0,0 +1,101 @@
+"""Typed game settings, parsed from config.toml in a single pass.
+
+tomllib's C-backed parse replaces the old configparser path, whose
+typed getters re-coerced strings on every call; values are stored as
+native TOML numbers so no unit-suffix stripping is needed either.
+"""
+
+import functools
+import os
+import tomllib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    player_name: str = 'Pilot'
+    screen_width: int = 1280
+    screen_height: int = 720
+    fullscreen: bool = False
+    fps: int = 60
+    ship_weight: float = 20000.0
+    ship_length: float = 30.0
+    ship_width: float = 15.0
+    max_thruster: float = 50000.0
+    max_reverse_thruster: float = 20000.0
+    max_steering_thruster: float = 1000.0
+    starting_vector: tuple = (0.0, 0.0, 0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class JoystickSettings:
+    """The [joystick] table, parsed lazily - desktops rarely need it."""
+    joystick_id: int = 0
+    enabled: bool = True
+    deadzone: float = 0.15
+    axis_yaw: int = 0
+    axis_pitch: int = 1
+    axis_roll: int = 2
+    axis_thrust: int = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _load_raw(path, mtime):
+    # mtime is only part of the key so an edited file invalidates the cache.
+    # One read + one C-level parse is the whole cost of a cold load; the
+    # bytes go straight to tomllib without any Python-level line scanning.
+    with open(path, 'rb') as f:
+        return tomllib.loads(f.read().decode('utf-8'))
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _build_settings(path, mtime):
+    raw = _load_raw(path, mtime)
+    player = raw.get('player', {})
+    display = raw.get('display', {})
+    ship = raw.get('ship', {})
+    return Settings(
+        player_name=player.get('name', 'Pilot'),
+        screen_width=display.get('screen_width', 1280),
+        screen_height=display.get('screen_height', 720),
+        fullscreen=display.get('fullscreen', False),
+        fps=display.get('fps', 60),
+        ship_weight=float(ship.get('weight', 20000)),
+        ship_length=float(ship.get('length', 30)),
+        ship_width=float(ship.get('width', 15)),
+        max_thruster=float(ship.get('max_thruster', 50000)),
+        max_reverse_thruster=float(ship.get('max_reverse_thruster', 20000)),
+        max_steering_thruster=float(ship.get('max_steering_thruster', 1000)),
+        starting_vector=tuple(ship.get('starting_vector', (0.0, 0.0, 0.0))),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _build_joystick_settings(path, mtime):
+    joystick = _load_raw(path, mtime).get('joystick', {})
+    return JoystickSettings(
+        joystick_id=joystick.get('id', 0),
+        enabled=joystick.get('enabled', True),
+        deadzone=float(joystick.get('deadzone', 0.15)),
+        axis_yaw=joystick.get('axis_yaw', 0),
+        axis_pitch=joystick.get('axis_pitch', 1),
+        axis_roll=joystick.get('axis_roll', 2),
+        axis_thrust=joystick.get('axis_thrust', 3),
+    )
+
+
+def load_settings(path='config.toml'):
+    """Parse the config once; repeat calls are served from the cache."""
+    return _build_settings(path, _mtime(path))
+
+
+def load_joystick_settings(path='config.toml'):
+    """Build only the joystick settings, on first use."""
+    return _build_joystick_settings(path, _mtime(path))
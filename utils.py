@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+
+
+def q_multiply(q1, q2):
+    """Multiply two quaternions given as (w, x, y, z); returns a tuple.
+
+    The tuple return skips ndarray construction entirely - all operands
+    are scalars after unpacking, and callers that need an array can wrap
+    the result themselves.
+    """
+    w1, x1, y1, z1 = q1
+    w2, x2, y2, z2 = q2
+    return (w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2)
+
+
+def q_from_axis_angle_into(axis, angle, out):
+    """Write the rotation quaternion for (axis, angle) into out[:4].
+
+    Scalar math throughout: np.linalg.norm and np.sin cost more in
+    dispatch than the whole computation does in arithmetic at this size,
+    and hot callers can reuse one scratch buffer instead of allocating.
+    """
+    ax, ay, az = axis
+    inv = 1.0 / math.sqrt(ax * ax + ay * ay + az * az)
+    half = angle * 0.5
+    s = math.sin(half) * inv
+    out[0] = math.cos(half)
+    out[1] = ax * s
+    out[2] = ay * s
+    out[3] = az * s
+    return out
+
+
+def q_from_axis_angle(axis, angle):
+    """Build a rotation quaternion from an axis and an angle in radians."""
+    return q_from_axis_angle_into(axis, angle, np.empty(4))
+
+
+def qv_rotate(q, v):
+    """Rotate vector v by unit quaternion q.
+
+    Uses t = 2*(q_xyz x v); v' = v + q_w*t + q_xyz x t instead of the
+    sandwich product q*v*q^-1: roughly half the work and no intermediate
+    quaternion allocations.
+    """
+    u = q[1:]
+    t = 2.0 * np.cross(u, v)
+    return v + q[0] * t + np.cross(u, t)
+
+
+# The optimized form started life under this name before it replaced
+# qv_rotate outright; existing call sites still import it.
+qv_rotate_fast = qv_rotate
+
+
+def mat_from_quat(q):
+    """3x3 rotation matrix for unit quaternion (w, x, y, z).
+
+    Costs ~12 multiplies once; after that every vector rotation is a
+    single matvec, and transforms compose by plain matrix products.
+    """
+    w, x, y, z = q
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    return np.array([
+        [1.0 - 2.0 * (yy + zz), 2.0 * (xy - wz), 2.0 * (xz + wy)],
+        [2.0 * (xy + wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz - wx)],
+        [2.0 * (xz - wy), 2.0 * (yz + wx), 1.0 - 2.0 * (xx + yy)]])
@@ -0,0 +1,17 @@
+"""Shared numba shim for the compiled kernels.
+
+numba is optional: when it is missing, `njit` degrades to a no-op
+decorator and `prange` to plain `range`, so the kernels in
+physics_numpy, game_objects and render_kernel still run as ordinary
+Python, only without the compilation speedup.
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; plain Python still works
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+    prange = range